@@ -4,14 +4,101 @@ PSDParser - Higher-level wrapper around the PSD class
 
 import os
 import io
-from typing import Dict, List, Tuple, Union, Optional, Any
-import numpy as np
+import mmap
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union, Optional, Any
 from .module import PSD, ColorMode, LayerType, BlendMode
 
+# numpy is only needed for annotations here; the arrays themselves are
+# created by the extension, so importing psdfile does not pull numpy in
+if TYPE_CHECKING:
+    import numpy as np
+
+_NOT_CACHED = object()
+
+# Basic information of recently loaded files, keyed by (abspath, mtime_ns, size)
+_FILE_INFO_CACHE_SIZE = 256
+_file_info_cache = OrderedDict()
+_file_info_lock = threading.Lock()
+
+def _file_info_key(path: str, st: os.stat_result) -> Tuple[str, int, int]:
+    """Build the file info cache key from a path and its stat result"""
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+def _lookup_file_info(key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    """Get a copy of the cached basic information for a file, or None"""
+    with _file_info_lock:
+        info = _file_info_cache.get(key)
+        if info is None:
+            return None
+        _file_info_cache.move_to_end(key)
+        return dict(info)
+
+def _store_file_info(key: Tuple[str, int, int], info: Dict[str, Any]):
+    """Cache the basic information for a file, evicting the oldest entries"""
+    with _file_info_lock:
+        _file_info_cache[key] = dict(info)
+        _file_info_cache.move_to_end(key)
+        while len(_file_info_cache) > _FILE_INFO_CACHE_SIZE:
+            _file_info_cache.popitem(last=False)
+
+def _unique_names(names: List[str], has_masks: Optional[List[bool]] = None) -> List[str]:
+    """
+    Make layer names unique by appending " (n)" to duplicates
+    
+    Args:
+        names: Layer names in layer order
+        has_masks: Per-layer flags; a "<name> (mask)" entry is reserved
+            for each layer whose flag is set
+        
+    Returns:
+        List[str]: Unique names in the same order
+    """
+    # Next suffix to try per name; also holds every name already emitted
+    seen = {}
+    seen_get = seen.get
+    seen_setdefault = seen.setdefault
+    unique_names = []
+    append = unique_names.append
+    for i, name in enumerate(names):
+        counter = seen_get(name, 0)
+        if not counter:
+            unique_name = name
+        else:
+            unique_name = f"{name} ({counter})"
+            while unique_name in seen:
+                counter += 1
+                unique_name = f"{name} ({counter})"
+            seen_setdefault(unique_name, 1)
+        seen[name] = counter + 1
+        append(unique_name)
+        
+        if has_masks is not None and has_masks[i]:
+            seen_setdefault(f"{unique_name} (mask)", 1)
+    
+    return unique_names
+
 class PSDParser:
     """
     A high-level interface for parsing and extracting data from PSD files.
     This class wraps the lower-level C++ bindings for a more Pythonic experience.
+    
+    Image data is returned as NumPy arrays that take ownership of the buffer
+    decoded on the C++ side, without an extra copy. Each call returns a new,
+    writable array that is independent of the parser and of other arrays.
+    
+    Loading, layer decoding and compositing run in native code with the GIL
+    released, so separate parsers can be used from several threads at once.
+    Image reads on one parser from several threads are serialized
+    internally, so they are safe but do not run in parallel. A parser must
+    not be loaded or closed while other threads are still reading from it.
+    
+    Use it as a context manager to release the loaded data (and the memory
+    map of a loaded file) deterministically:
+    
+        with PSDParser("path/to/file.psd") as parser:
+            image = parser.get_blend()
     """
     
     def __init__(self, file_path=None, file_data=None):
@@ -24,6 +111,8 @@ class PSDParser:
         """
         self.psd = PSD()
         self._loaded = False
+        self._mm = None
+        self._clear_cache()
         
         if file_path or file_data:
             self.load(file_path if file_path else file_data)
@@ -33,28 +122,68 @@ class PSDParser:
         """Check if a PSD file is loaded"""
         return self._loaded
     
-    def load(self, source: Union[str, bytes, io.BytesIO]) -> bool:
+    def _assert_loaded(self):
+        """Raise RuntimeError if no PSD data is loaded"""
+        if not self._loaded:
+            raise RuntimeError("No PSD data loaded")
+    
+    def close(self):
         """
-        Load PSD data from a file path, bytes, or BytesIO object
+        Release the loaded PSD data and the memory map of a loaded file
+        
+        Arrays already returned stay valid. The parser can be loaded again
+        afterwards.
+        """
+        self.psd.clear()
+        self._close_mapping()
+        self._clear_cache()
+        self._loaded = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _clear_cache(self):
+        """Drop metadata cached from the previously loaded PSD"""
+        self._info_cache = None
+        self._width = None
+        self._height = None
+        self._channels = None
+        self._depth = None
+        self._color_mode = None
+        self._layer_count = None
+        # None is a valid result for these, so use a sentinel for "not fetched"
+        self._slices_cache = _NOT_CACHED
+        self._guides_cache = _NOT_CACHED
+        self._layer_comp_cache = _NOT_CACHED
+    
+    def load(self, source: Union[str, bytes, bytearray, memoryview, io.BytesIO]) -> bool:
+        """
+        Load PSD data from a file path, bytes, buffer, or BytesIO object
+        
+        bytes, bytearray and memoryview sources are used in place without
+        copying, so bytearray and memoryview contents must not be modified
+        while loaded.
         
         Args:
-            source: File path, bytes, or BytesIO object containing PSD data
+            source: File path, bytes, bytearray, memoryview, or BytesIO object containing PSD data
             
         Returns:
             bool: True if loading was successful, False otherwise
         """
+        # Check the source type before closing, so an unsupported source
+        # keeps the previously loaded data
+        try:
+            loader = self._find_loader(source)
+        except TypeError as e:
+            raise RuntimeError(f"Failed to load PSD: {str(e)}") from e
+        
+        # Drop the previous data first so its source can be freed right away
+        self.close()
         try:
-            if isinstance(source, str):
-                # Load from file path
-                result = self.psd.load_from_file(source)
-            elif isinstance(source, bytes):
-                # Load from bytes
-                result = self.psd.load_from_bytes(source)
-            elif isinstance(source, io.BytesIO):
-                # Load from BytesIO
-                result = self.psd.load_from_bytes(source.getvalue())
-            else:
-                raise TypeError(f"Unsupported source type: {type(source)}")
+            result = loader(self, source)
             
             self._loaded = result
             return result
@@ -62,6 +191,103 @@ class PSDParser:
             self._loaded = False
             raise RuntimeError(f"Failed to load PSD: {str(e)}") from e
     
+    @classmethod
+    def _find_loader(cls, source):
+        """Get the loader for a source, raising TypeError if unsupported"""
+        loader = cls._LOADERS.get(type(source))
+        if loader is None:
+            # Fall back to isinstance checks for subclasses
+            for source_type, source_loader in cls._LOADERS.items():
+                if isinstance(source, source_type):
+                    return source_loader
+            raise TypeError(f"Unsupported source type: {type(source)}")
+        return loader
+    
+    def _close_mapping(self):
+        """Close the memory map of the previously loaded file, if any"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+    
+    def _load_mapped_file(self, path: str) -> bool:
+        """
+        Memory-map a PSD file and load it without copying its contents
+        
+        The mapping is kept on the instance because the parsed layer data
+        keeps referring to it.
+        
+        Args:
+            path: Path to the PSD file
+            
+        Returns:
+            bool: True if loading was successful, False otherwise
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            st = os.fstat(fd)
+            if st.st_size == 0:
+                # An empty file cannot be mapped and is not a PSD file anyway
+                return False
+            key = _file_info_key(path, st)
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        
+        try:
+            result = self.psd.load_from_buffer(memoryview(mm))
+        except Exception:
+            # The C++ side releases the buffer before propagating errors
+            mm.close()
+            raise
+        if not result:
+            mm.close()
+            return result
+        
+        self._mm = mm
+        # Seed the file info cache so later read_info() calls on this
+        # file do not parse it again
+        self._info_cache = self.psd.get_basic_info()
+        _store_file_info(key, self._info_cache)
+        return result
+    
+    # Loader for each supported source type, looked up by exact type in load()
+    _LOADERS = {
+        # File path (memory-mapped, pages are read on demand)
+        str: _load_mapped_file,
+        # Buffers are used in place, no copy; bytes is immutable, so
+        # referencing it is safe and avoids a file-sized copy in C++
+        bytes: lambda self, source: self.psd.load_from_buffer(source),
+        bytearray: lambda self, source: self.psd.load_from_buffer(source),
+        memoryview: lambda self, source: self.psd.load_from_buffer(source),
+        # getvalue() shares the bytes a BytesIO was created from and, unlike
+        # getbuffer(), does not lock the stream against resizing or closing
+        io.BytesIO: lambda self, source: self.psd.load_from_buffer(source.getvalue()),
+    }
+    
+    @staticmethod
+    def read_info(file_path: str) -> Dict[str, Any]:
+        """
+        Get basic information about a PSD file without keeping it loaded
+        
+        Results are cached per (path, modification time, size), so repeated
+        calls for an unchanged file do not parse it again.
+        
+        Args:
+            file_path: Path to a PSD file
+            
+        Returns:
+            Dict: Basic information about the PSD file
+        """
+        key = _file_info_key(file_path, os.stat(file_path))
+        info = _lookup_file_info(key)
+        if info is None:
+            psd = PSD()
+            if not psd.load_from_file(file_path):
+                raise RuntimeError(f"Failed to load PSD: {file_path}")
+            info = psd.get_basic_info()
+            _store_file_info(key, info)
+        return info
+    
     def parse(self):
         """
         Parse the loaded PSD file and return basic information
@@ -69,46 +295,68 @@ class PSDParser:
         Returns:
             Dict: Basic information about the PSD file
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_basic_info()
+        self._assert_loaded()
+        return dict(self._get_basic_info())
     
     @property
     def info(self) -> Dict[str, Any]:
         """Get basic information about the PSD file"""
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_basic_info()
+        self._assert_loaded()
+        return dict(self._get_basic_info())
+    
+    def _get_basic_info(self) -> Dict[str, Any]:
+        """Get the cached basic information dict, fetching it only once per load"""
+        if self._info_cache is None:
+            self._info_cache = self.psd.get_basic_info()
+        return self._info_cache
+    
+    def _ensure_header(self):
+        """Populate the header attributes from the cached basic information"""
+        if self._width is None:
+            # Unloaded parsers report -1 for every header value
+            info = self._get_basic_info() if self._loaded else {}
+            self._width = info.get("width", -1)
+            self._height = info.get("height", -1)
+            self._channels = info.get("channels", -1)
+            self._depth = info.get("depth", -1)
+            self._color_mode = info.get("color_mode", -1)
+            self._layer_count = info.get("layer_count", -1)
     
     @property
     def width(self) -> int:
         """Get the width of the PSD image"""
-        return self.psd.width
+        self._ensure_header()
+        return self._width
     
     @property
     def height(self) -> int:
         """Get the height of the PSD image"""
-        return self.psd.height
+        self._ensure_header()
+        return self._height
     
     @property
     def channels(self) -> int:
         """Get the number of channels in the PSD image"""
-        return self.psd.channels
+        self._ensure_header()
+        return self._channels
     
     @property
     def depth(self) -> int:
         """Get the bit depth of the PSD image"""
-        return self.psd.depth
+        self._ensure_header()
+        return self._depth
     
     @property
     def color_mode(self) -> int:
         """Get the color mode of the PSD image"""
-        return self.psd.color_mode
+        self._ensure_header()
+        return self._color_mode
     
     @property
     def layer_count(self) -> int:
         """Get the number of layers in the PSD image"""
-        return self.psd.layer_count
+        self._ensure_header()
+        return self._layer_count
     
     def get_layer_type(self, layer_no: int) -> int:
         """
@@ -120,8 +368,7 @@ class PSDParser:
         Returns:
             int: Layer type constant
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
+        self._assert_loaded()
         return self.psd.get_layer_type(layer_no)
     
     def get_layer_name(self, layer_no: int) -> str:
@@ -134,10 +381,19 @@ class PSDParser:
         Returns:
             str: Layer name
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
+        self._assert_loaded()
         return self.psd.get_layer_name(layer_no)
     
+    def get_all_layer_names(self) -> List[str]:
+        """
+        Get the names of all layers in a single call
+        
+        Returns:
+            List[str]: Layer names in layer order
+        """
+        self._assert_loaded()
+        return self.psd.get_all_layer_names()
+    
     def get_layer_info(self, layer_no: int) -> Dict[str, Any]:
         """
         Get detailed information about a layer
@@ -148,95 +404,154 @@ class PSDParser:
         Returns:
             Dict: Layer information dictionary
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
+        self._assert_loaded()
         return self.psd.get_layer_info(layer_no)
     
-    def get_layer_data(self, layer_no: int) -> np.ndarray:
+    def has_layer_mask(self, layer_no: int) -> bool:
+        """
+        Check whether a layer has a mask, without decoding it
+        
+        Any non-empty mask rectangle counts, including a 1x1 mask.
+        
+        Args:
+            layer_no: Layer index (0-based)
+            
+        Returns:
+            bool: True if the layer has a non-empty mask
+        """
+        self._assert_loaded()
+        return self.psd.has_layer_mask(layer_no)
+    
+    def get_layer_data(self, layer_no: int, channel: Optional[int] = None) -> "np.ndarray":
         """
         Get layer image data with mask applied
         
         Args:
             layer_no: Layer index (0-based)
+            channel: Optional channel index in BGRA order (0=B, 1=G, 2=R, 3=A)
+                to get only that channel as an HxW array
             
         Returns:
-            numpy.ndarray: Layer image data as BGRA numpy array
+            numpy.ndarray: Layer image data as BGRA numpy array, or HxW if channel is given
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_layer_data(layer_no)
+        self._assert_loaded()
+        return self.psd.get_layer_data(layer_no, channel=channel)
+    
+    def get_layer_alpha(self, layer_no: int) -> "np.ndarray":
+        """
+        Get the alpha channel of a layer with mask applied
+        
+        Args:
+            layer_no: Layer index (0-based)
+            
+        Returns:
+            numpy.ndarray: Layer alpha as HxW numpy array
+        """
+        return self.get_layer_data(layer_no, channel=3)
+    
+    def get_layers_data(self, layer_nos: List[int], with_mask: bool = False) -> List[Any]:
+        """
+        Get image data of multiple layers at once
+        
+        All layers are decoded in one native call with the GIL released.
+        
+        Args:
+            layer_nos: Layer indices (0-based)
+            with_mask: Whether to also get the layer masks (default: False)
+            
+        Returns:
+            List: BGRA numpy arrays in the order of layer_nos, or
+                (image, mask) tuples if with_mask is True, where mask is
+                None for layers without a mask
+        """
+        self._assert_loaded()
+        return self.psd.get_layers_data(list(layer_nos), with_mask)
     
-    def get_layer_data_raw(self, layer_no: int) -> np.ndarray:
+    def get_layer_data_raw(self, layer_no: int, channel: Optional[int] = None) -> "np.ndarray":
         """
         Get raw layer image data without mask applied
         
         Args:
             layer_no: Layer index (0-based)
+            channel: Optional channel index in BGRA order (0=B, 1=G, 2=R, 3=A)
+                to get only that channel as an HxW array
             
         Returns:
-            numpy.ndarray: Raw layer image data as BGRA numpy array
+            numpy.ndarray: Raw layer image data as BGRA numpy array, or HxW if channel is given
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_layer_data_raw(layer_no)
+        self._assert_loaded()
+        return self.psd.get_layer_data_raw(layer_no, channel=channel)
     
-    def get_layer_data_mask(self, layer_no: int) -> np.ndarray:
+    def get_layer_data_mask(self, layer_no: int, channel: Optional[int] = None) -> "np.ndarray":
         """
         Get layer mask data
         
         Args:
             layer_no: Layer index (0-based)
+            channel: Optional channel index in BGRA order (0=B, 1=G, 2=R, 3=A)
+                to get only that channel as an HxW array
             
         Returns:
-            numpy.ndarray: Layer mask data as BGRA numpy array
+            numpy.ndarray: Layer mask data as BGRA numpy array, or HxW if channel is given
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_layer_data_mask(layer_no)
+        self._assert_loaded()
+        return self.psd.get_layer_data_mask(layer_no, channel=channel)
     
-    def get_blend(self) -> np.ndarray:
+    def get_blend(self, channel: Optional[int] = None) -> "np.ndarray":
         """
         Get the composite image
         
+        Args:
+            channel: Optional channel index in BGRA order (0=B, 1=G, 2=R, 3=A)
+                to get only that channel as an HxW array
+            
         Returns:
-            numpy.ndarray: Composite image data as BGRA numpy array
+            numpy.ndarray: Composite image data as BGRA numpy array, or HxW if channel is given
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_blend()
+        self._assert_loaded()
+        return self.psd.get_blend(channel=channel)
     
     def get_slices(self) -> Optional[Dict[str, Any]]:
         """
         Get slice information
         
         Returns:
-            Dict or None: Slice information dictionary, or None if no slices exist
-        """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_slices()
+            Dict or None: Slice information dictionary, or None if no slices exist.
+                The result is cached and shared between calls, so copy it
+                before modifying it.
+        """
+        self._assert_loaded()
+        if self._slices_cache is _NOT_CACHED:
+            self._slices_cache = self.psd.get_slices()
+        return self._slices_cache
     
     def get_guides(self) -> Optional[Dict[str, Any]]:
         """
         Get guide information
         
         Returns:
-            Dict or None: Guide information dictionary, or None if no guides exist
-        """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_guides()
+            Dict or None: Guide information dictionary, or None if no guides exist.
+                The result is cached and shared between calls, so copy it
+                before modifying it.
+        """
+        self._assert_loaded()
+        if self._guides_cache is _NOT_CACHED:
+            self._guides_cache = self.psd.get_guides()
+        return self._guides_cache
     
     def get_layer_comp(self) -> Optional[Dict[str, Any]]:
         """
         Get layer composition information
         
         Returns:
-            Dict or None: Layer composition dictionary, or None if no compositions exist
-        """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
-        return self.psd.get_layer_comp()
+            Dict or None: Layer composition dictionary, or None if no compositions exist.
+                The result is cached and shared between calls, so copy it
+                before modifying it.
+        """
+        self._assert_loaded()
+        if self._layer_comp_cache is _NOT_CACHED:
+            self._layer_comp_cache = self.psd.get_layer_comp()
+        return self._layer_comp_cache
     
     def assign_auto_ids(self, base_id: int = 0) -> int:
         """
@@ -248,8 +563,7 @@ class PSDParser:
         Returns:
             int: Number of layers that were assigned IDs
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
+        self._assert_loaded()
         return self.psd.assign_auto_ids(base_id)
     
     def get_all_layers_info(self) -> List[Dict[str, Any]]:
@@ -259,12 +573,11 @@ class PSDParser:
         Returns:
             List[Dict]: List of layer information dictionaries
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
+        self._assert_loaded()
         
-        return [self.get_layer_info(i) for i in range(self.layer_count)]
+        return self.psd.get_all_layers_info()
     
-    def extract_all_layers(self, get_mask: bool = False) -> Dict[str, np.ndarray]:
+    def extract_all_layers(self, get_mask: bool = False) -> Dict[str, "np.ndarray"]:
         """
         Extract all layer images
         
@@ -274,28 +587,22 @@ class PSDParser:
         Returns:
             Dict[str, np.ndarray]: Dictionary mapping layer names to image data
         """
-        if not self._loaded:
-            raise RuntimeError("No PSD data loaded")
+        self._assert_loaded()
+        psd = self.psd
+        
+        names = psd.get_all_layer_names()
+        datas = psd.get_layers_data(list(range(len(names))), get_mask)
         
+        if not get_mask:
+            return dict(zip(_unique_names(names), datas))
+        
+        # Layers without a mask are not decoded and come back as None.
+        # Unlike the old 1x1 shape check, a real 1x1 mask is kept.
+        has_masks = [mask_data is not None for _, mask_data in datas]
         result = {}
-        for i in range(self.layer_count):
-            name = self.get_layer_name(i)
-            unique_name = name
-            counter = 1
-            
-            # Handle duplicate layer names
-            while unique_name in result:
-                unique_name = f"{name} ({counter})"
-                counter += 1
-            
-            result[unique_name] = self.get_layer_data(i)
-            
-            if get_mask:
-                mask_name = f"{unique_name} (mask)"
-                mask_data = self.get_layer_data_mask(i)
-                
-                # Check if mask has data (not a dummy 1x1 mask)
-                if mask_data.shape[0] > 1 or mask_data.shape[1] > 1:
-                    result[mask_name] = mask_data
-        
-        return result
\ No newline at end of file
+        for unique_name, (layer_data, mask_data) in zip(_unique_names(names, has_masks), datas):
+            result[unique_name] = layer_data
+            if mask_data is not None:
+                result[f"{unique_name} (mask)"] = mask_data
+        
+        return result
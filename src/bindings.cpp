@@ -5,6 +5,9 @@
 #include <vector>
 #include <fstream>
 #include <memory>
+#include <algorithm>
+#include <mutex>
+#include <optional>
 
 #include "psdparse/psdfile.h" 
 #include "psdparse/psdparse.h"
@@ -15,15 +18,81 @@
 
 #include <boost/locale.hpp>
 
+// x64 では SSE2 が常に使える
+#if defined(__SSE2__) || defined(_M_X64) || (defined(_M_IX86_FP) && _M_IX86_FP >= 2)
+#include <emmintrin.h>
+#define PSDFILE_USE_SSE2
+#endif
+
 std::string wstring_to_string(const std::wstring& wstr) {
     return boost::locale::conv::utf_to_utf<char>(wstr);
 }
 
 namespace py = pybind11;
 
+// 画像バッファの所有権をNumPy配列に移して返す（コピーなし）
+// 配列が破棄されたときにバッファも解放される
+// channels が 1 の場合は (height, width)、それ以外は (height, width, channels) の配列になる
+py::array_t<uint8_t> wrapImageBuffer(std::unique_ptr<std::vector<uint8_t>> buffer, int width, int height, int channels = 4) {
+    uint8_t *data = buffer->data();
+    py::capsule owner(buffer.get(), [](void *p) {
+        delete static_cast<std::vector<uint8_t>*>(p);
+    });
+    buffer.release();
+    if (channels == 1) {
+        return py::array_t<uint8_t>(
+            std::vector<py::ssize_t>{height, width},
+            std::vector<py::ssize_t>{width, 1},
+            data, owner);
+    }
+    return py::array_t<uint8_t>(
+        std::vector<py::ssize_t>{height, width, channels},
+        std::vector<py::ssize_t>{static_cast<py::ssize_t>(width) * channels, channels, 1},
+        data, owner);
+}
+
+// チャンネル指定の検証（BGRA順のインデックス）
+void checkChannel(const std::optional<int>& channel) {
+    if (channel && (*channel < 0 || *channel > 3)) {
+        throw py::value_error("channel must be 0 (B), 1 (G), 2 (R) or 3 (A)");
+    }
+}
+
+// BGRAバッファから1チャンネル分だけを詰めたバッファを作成
+std::unique_ptr<std::vector<uint8_t>> extractChannel(const std::vector<uint8_t>& bgra, int width, int height, int channel) {
+    size_t count = static_cast<size_t>(width) * height;
+    std::unique_ptr<std::vector<uint8_t>> plane(new std::vector<uint8_t>(count));
+    const uint8_t *src = bgra.data();
+    uint8_t *dst = plane->data();
+    size_t i = 0;
+#ifdef PSDFILE_USE_SSE2
+    // 16画素ずつ処理: 画素(32bit)ごとに対象チャンネルを下位バイトへシフトしてから
+    // 32bit -> 16bit -> 8bit とパックして詰める
+    const __m128i lowByte = _mm_set1_epi32(0xff);
+    const __m128i shift = _mm_cvtsi32_si128(channel * 8);
+    for (; i + 16 <= count; i += 16) {
+        const __m128i *p = reinterpret_cast<const __m128i*>(src + i * 4);
+        __m128i a = _mm_and_si128(_mm_srl_epi32(_mm_loadu_si128(p + 0), shift), lowByte);
+        __m128i b = _mm_and_si128(_mm_srl_epi32(_mm_loadu_si128(p + 1), shift), lowByte);
+        __m128i c = _mm_and_si128(_mm_srl_epi32(_mm_loadu_si128(p + 2), shift), lowByte);
+        __m128i d = _mm_and_si128(_mm_srl_epi32(_mm_loadu_si128(p + 3), shift), lowByte);
+        __m128i packed = _mm_packus_epi16(_mm_packs_epi32(a, b), _mm_packs_epi32(c, d));
+        _mm_storeu_si128(reinterpret_cast<__m128i*>(dst + i), packed);
+    }
+#endif
+    for (; i < count; i++) {
+        dst[i] = src[i * 4 + channel];
+    }
+    return plane;
+}
+
 class PythonPSD : public psd::PSDFile {
 private:
     std::vector<uint8_t> fileData; // メモリ上に保持するPSDファイルデータ
+    std::unique_ptr<py::buffer_info> sourceBuffer; // 参照中のPython側バッファ（コピーせずに保持）
+    // psdparse のデコード・合成処理は同一オブジェクトからの同時呼び出しが
+    // 保証されていないため、オブジェクトごとに直列化する
+    std::mutex decodeMutex;
 
 public:
     PythonPSD() {}
@@ -32,11 +101,39 @@ public:
     void clearData() {
         psd::PSDFile::clearData();
         fileData.clear();
+        fileData.shrink_to_fit();
+        sourceBuffer.reset();
+        isLoaded = false;
+    }
+
+    // メモリ上のPSDデータを解析
+    // 解析中はGILを解放する。バッファの解放はGILを取得してから行い、
+    // 例外時も参照中のバッファを解放してから再送出する
+    bool parseMemory(unsigned char *begin, size_t size) {
+        try {
+            py::gil_scoped_release release;
+            psd::Parser<uint8_t*> parser(*this);
+            unsigned char *end   = begin + size;
+            bool r = parse(begin , end,  parser);
+            if (r && begin == end) {
+                dprint("succeeded\n");
+                isLoaded = processParsed();
+            }
+        } catch (...) {
+            clearData();
+            throw;
+        }
+        if (!isLoaded) {
+            clearData();
+        }
+        return isLoaded;
     }
 
     // ファイルからの読み込み
     bool loadFromFile(const std::string& filepath) {
         clearData();
+        // 読み込み中はGILを解放
+        py::gil_scoped_release release;
         // For Windows, convert string to wstring before loading
 #ifdef _WIN32
         std::wstring wideFilepath;
@@ -57,23 +154,32 @@ public:
     bool loadFromBytes(py::bytes bytes) {
         clearData();
         
-        // Python側のバイトデータをstd::vectorにコピー
-        std::string buffer = static_cast<std::string>(bytes);
-        fileData.assign(buffer.begin(), buffer.end());
-        
-        psd::Parser<uint8_t*> parser(*this);
-        unsigned char *begin = fileData.data();
-        size_t size = fileData.size();
-        unsigned char *end   = begin + size;
-        bool r = parse(begin , end,  parser);
-        if (r && begin == end) {
-            dprint("succeeded\n");
-            isLoaded = processParsed();
+        // Python側のバイトデータをstd::vectorにコピー（中間バッファなし）
+        char *data = nullptr;
+        Py_ssize_t size = 0;
+        if (PyBytes_AsStringAndSize(bytes.ptr(), &data, &size) != 0) {
+            throw py::error_already_set();
         }
-        if (!isLoaded) {
-            clearData();
+        fileData.assign(data, data + size);
+        
+        return parseMemory(fileData.data(), fileData.size());
+    }
+
+    // バッファプロトコル対応オブジェクト(mmap, memoryview等)からの読み込み
+    // データはコピーせず、バッファを保持したまま参照する
+    bool loadFromBuffer(py::buffer buffer) {
+        clearData();
+
+        sourceBuffer.reset(new py::buffer_info(buffer.request()));
+        const py::buffer_info& info = *sourceBuffer;
+        if (info.ndim != 1 || info.strides[0] != info.itemsize) {
+            sourceBuffer.reset();
+            throw std::runtime_error("Buffer must be contiguous and one-dimensional");
         }
-        return isLoaded;
+
+        unsigned char *begin = static_cast<unsigned char*>(info.ptr);
+        size_t size = static_cast<size_t>(info.size * info.itemsize);
+        return parseMemory(begin, size);
     }
 
     // 基本情報を辞書で取得
@@ -113,8 +219,52 @@ public:
         return lay.layerName;
     }
 
-    // レイヤー情報をPython辞書で取得
-    py::dict getLayerInfo(int layerNo) const {
+    // 全レイヤー名を一括取得
+    std::vector<std::string> getAllLayerNames() const {
+        if (!isLoaded) {
+            throw std::runtime_error("No PSD data loaded");
+        }
+
+        std::vector<std::string> names;
+        names.reserve(layerList.size());
+        for (int i = 0; i < static_cast<int>(layerList.size()); i++) {
+            names.push_back(getLayerName(i));
+        }
+        return names;
+    }
+
+    // レイヤー情報辞書のキー
+    // 全レイヤー取得時は一度だけ作成して使い回す
+    struct LayerInfoKeys {
+        py::str top{"top"};
+        py::str left{"left"};
+        py::str bottom{"bottom"};
+        py::str right{"right"};
+        py::str width{"width"};
+        py::str height{"height"};
+        py::str opacity{"opacity"};
+        py::str fill_opacity{"fill_opacity"};
+        py::str mask{"mask"};
+        py::str type{"type"};
+        py::str layer_type{"layer_type"};
+        py::str blend_mode{"blend_mode"};
+        py::str visible{"visible"};
+        py::str name{"name"};
+        py::str clipping{"clipping"};
+        py::str layer_id{"layer_id"};
+        py::str obsolete{"obsolete"};
+        py::str transparency_protected{"transparency_protected"};
+        py::str pixel_data_irrelevant{"pixel_data_irrelevant"};
+        py::str group_layer_id{"group_layer_id"};
+        py::str id{"id"};
+        py::str offset_x{"offset_x"};
+        py::str offset_y{"offset_y"};
+        py::str enable{"enable"};
+        py::str layer_comp{"layer_comp"};
+    };
+
+    // レイヤー情報をPython辞書で作成
+    py::dict buildLayerInfo(int layerNo, const LayerInfoKeys& keys) const {
         py::dict result;
         if (!isLoaded || layerNo < 0 || layerNo >= static_cast<int>(layerList.size())) {
             throw std::runtime_error("Invalid layer number or no PSD data loaded");
@@ -123,14 +273,14 @@ public:
         const psd::LayerInfo& lay = layerList[layerNo];
         
         // 基本情報
-        result["top"] = lay.top;
-        result["left"] = lay.left;
-        result["bottom"] = lay.bottom;
-        result["right"] = lay.right;
-        result["width"] = lay.width;
-        result["height"] = lay.height;
-        result["opacity"] = lay.opacity;
-        result["fill_opacity"] = lay.fill_opacity;
+        result[keys.top] = lay.top;
+        result[keys.left] = lay.left;
+        result[keys.bottom] = lay.bottom;
+        result[keys.right] = lay.right;
+        result[keys.width] = lay.width;
+        result[keys.height] = lay.height;
+        result[keys.opacity] = lay.opacity;
+        result[keys.fill_opacity] = lay.fill_opacity;
 
         // マスク情報チェック
         bool hasMask = false;
@@ -140,7 +290,7 @@ public:
                 break;
             }
         }
-        result["mask"] = hasMask;
+        result[keys.mask] = hasMask;
 
         // ブレンドモード変換用ヘルパー関数
         auto convBlendModeToString = [](psd::BlendMode mode) -> std::string {
@@ -165,22 +315,22 @@ public:
         };
         
         // ブレンドモードと種別
-        result["type"] = convBlendModeToString(lay.blendMode);
-        result["layer_type"] = static_cast<int>(lay.layerType);
-        result["blend_mode"] = static_cast<int>(lay.blendMode);
-        result["visible"] = lay.isVisible();
-        result["name"] = getLayerName(layerNo);
+        result[keys.type] = convBlendModeToString(lay.blendMode);
+        result[keys.layer_type] = static_cast<int>(lay.layerType);
+        result[keys.blend_mode] = static_cast<int>(lay.blendMode);
+        result[keys.visible] = lay.isVisible();
+        result[keys.name] = getLayerName(layerNo);
         
         // 追加情報
-        result["clipping"] = lay.clipping;
-        result["layer_id"] = lay.layerId;
-        result["obsolete"] = lay.isObsolete();
-        result["transparency_protected"] = lay.isTransparencyProtected();
-        result["pixel_data_irrelevant"] = lay.isPixelDataIrrelevant();
+        result[keys.clipping] = lay.clipping;
+        result[keys.layer_id] = lay.layerId;
+        result[keys.obsolete] = lay.isObsolete();
+        result[keys.transparency_protected] = lay.isTransparencyProtected();
+        result[keys.pixel_data_irrelevant] = lay.isPixelDataIrrelevant();
         
         // グループレイヤー情報
         if (lay.parent != nullptr) {
-            result["group_layer_id"] = lay.parent->layerId;
+            result[keys.group_layer_id] = lay.parent->layerId;
         }
         
         // レイヤーカンプ情報
@@ -189,20 +339,59 @@ public:
             for (const auto& comp_pair : lay.layerComps) {
                 py::dict tmp;
                 const psd::LayerCompInfo& comp = comp_pair.second;
-                tmp["id"] = comp.id;
-                tmp["offset_x"] = comp.offsetX;
-                tmp["offset_y"] = comp.offsetY;
-                tmp["enable"] = comp.isEnabled;
+                tmp[keys.id] = comp.id;
+                tmp[keys.offset_x] = comp.offsetX;
+                tmp[keys.offset_y] = comp.offsetY;
+                tmp[keys.enable] = comp.isEnabled;
                 compDict[py::cast(comp.id)] = tmp;
             }
-            result["layer_comp"] = compDict;
+            result[keys.layer_comp] = compDict;
         }
         
         return result;
     }
 
-    // レイヤーデータをNumPy配列として取得
-    py::array_t<uint8_t> getLayerData(int layerNo, const std::string& mode = "maskedimage") {
+    // レイヤー情報をPython辞書で取得
+    py::dict getLayerInfo(int layerNo) const {
+        LayerInfoKeys keys;
+        return buildLayerInfo(layerNo, keys);
+    }
+
+    // 全レイヤーの情報をPython辞書のリストで取得
+    py::list getAllLayersInfo() const {
+        if (!isLoaded) {
+            throw std::runtime_error("No PSD data loaded");
+        }
+
+        LayerInfoKeys keys;
+        py::list result;
+        for (int i = 0; i < static_cast<int>(layerList.size()); i++) {
+            result.append(buildLayerInfo(i, keys));
+        }
+        return result;
+    }
+
+    // レイヤーマスクの有無を取得（画素はデコードしない）
+    bool hasLayerMask(int layerNo) const {
+        if (!isLoaded || layerNo < 0 || layerNo >= static_cast<int>(layerList.size())) {
+            throw std::runtime_error("Invalid layer number or no PSD data loaded");
+        }
+        const psd::LayerMask& mask = layerList[layerNo].extraData.layerMask;
+        return mask.width > 0 && mask.height > 0;
+    }
+
+    // レイヤー画像の取得条件
+    struct LayerImageRequest {
+        const psd::LayerInfo *lay;
+        psd::ImageMode imageMode;
+        int width;
+        int height;
+        bool dummy;       // マスクが無い場合の1x1ダミー
+        int defaultColor; // ダミーマスクの色
+    };
+
+    // 取得条件を検証して作成
+    LayerImageRequest makeLayerImageRequest(int layerNo, const std::string& mode) const {
         if (!isLoaded || layerNo < 0 || layerNo >= static_cast<int>(layerList.size())) {
             throw std::runtime_error("Invalid layer number or no PSD data loaded");
         }
@@ -210,71 +399,126 @@ public:
         const psd::LayerInfo& lay = layerList[layerNo];
         const psd::LayerMask& mask = lay.extraData.layerMask;
         
-        int left, top, width, height;
-        psd::ImageMode imageMode;
+        LayerImageRequest req;
+        req.lay = &lay;
+        req.dummy = false;
+        req.defaultColor = 0;
         
         if (mode == "mask") {
             // マスクのみ
-            imageMode = psd::IMAGE_MODE_MASK;
-            left = mask.left;
-            top = mask.top;
-            width = mask.width;
-            height = mask.height;
+            req.imageMode = psd::IMAGE_MODE_MASK;
+            req.width = mask.width;
+            req.height = mask.height;
             
-            if (width <= 0 || height <= 0) {
+            if (req.width <= 0 || req.height <= 0) {
                 // ダミーのマスクを作成
-                width = height = 1;
-                py::array_t<uint8_t> dummyArray({1, 1, 4});
-                auto buf = dummyArray.mutable_unchecked<3>();
-                buf(0, 0, 0) = buf(0, 0, 1) = buf(0, 0, 2) = mask.defaultColor;
-                buf(0, 0, 3) = 255;
-                return dummyArray;
+                req.width = req.height = 1;
+                req.dummy = true;
+                req.defaultColor = mask.defaultColor;
+                return req;
             }
         } else if (mode == "raw") {
             // 生イメージ
-            imageMode = psd::IMAGE_MODE_IMAGE;
-            left = lay.left;
-            top = lay.top;
-            width = lay.width;
-            height = lay.height;
+            req.imageMode = psd::IMAGE_MODE_IMAGE;
+            req.width = lay.width;
+            req.height = lay.height;
         } else {
             // マスク適用済み（デフォルト）
-            imageMode = psd::IMAGE_MODE_MASKEDIMAGE;
-            left = lay.left;
-            top = lay.top;
-            width = lay.width;
-            height = lay.height;
+            req.imageMode = psd::IMAGE_MODE_MASKEDIMAGE;
+            req.width = lay.width;
+            req.height = lay.height;
         }
         
-        if (width <= 0 || height <= 0) {
+        if (req.width <= 0 || req.height <= 0) {
             throw std::runtime_error("Layer has zero width or height");
         }
-        
-        // BGRA形式でデータを取得するためのバッファを作成
-        py::array_t<uint8_t> array({height, width, 4});
-        auto buf = array.mutable_unchecked<3>();
-        
+        return req;
+    }
+
+    // BGRA形式のバッファにデコード
+    // Pythonオブジェクトに触れないため、GILを解放した状態で呼び出せる
+    std::unique_ptr<std::vector<uint8_t>> decodeLayerImage(const LayerImageRequest& req) {
         // 1行あたりのバイト数
-        int pitch = width * 4;
+        int pitch = req.width * 4;
         
-        // 画像データを取得
-        std::vector<uint8_t> buffer(pitch * height);
-        getLayerImage(lay, buffer.data(), psd::BGRA_LE, pitch, imageMode);
-        
-        // NumPy配列にデータをコピー
-        for (int y = 0; y < height; y++) {
-            for (int x = 0; x < width; x++) {
-                for (int c = 0; c < 4; c++) {
-                    buf(y, x, c) = buffer[y * pitch + x * 4 + c];
+        std::unique_ptr<std::vector<uint8_t>> buffer(new std::vector<uint8_t>(static_cast<size_t>(pitch) * req.height));
+        if (req.dummy) {
+            uint8_t *p = buffer->data();
+            p[0] = p[1] = p[2] = static_cast<uint8_t>(req.defaultColor);
+            p[3] = 255;
+        } else {
+            std::lock_guard<std::mutex> lock(decodeMutex);
+            getLayerImage(*req.lay, buffer->data(), psd::BGRA_LE, pitch, req.imageMode);
+        }
+        return buffer;
+    }
+
+    // レイヤーデータをNumPy配列として取得
+    // channel を指定した場合はそのチャンネルだけの (height, width) 配列を返す
+    py::array_t<uint8_t> getLayerData(int layerNo, const std::string& mode = "maskedimage", std::optional<int> channel = std::nullopt) {
+        checkChannel(channel);
+        LayerImageRequest req = makeLayerImageRequest(layerNo, mode);
+        std::unique_ptr<std::vector<uint8_t>> buffer;
+        {
+            // デコード中はGILを解放
+            py::gil_scoped_release release;
+            buffer = decodeLayerImage(req);
+            if (channel) {
+                buffer = extractChannel(*buffer, req.width, req.height, *channel);
+            }
+        }
+        return wrapImageBuffer(std::move(buffer), req.width, req.height, channel ? 1 : 4);
+    }
+
+    // 複数レイヤーのデータをまとめて取得
+    // デコードはGILを一度だけ解放してまとめて行う
+    py::list getLayersData(const std::vector<int>& layerNos, bool withMask = false) {
+        std::vector<LayerImageRequest> requests;
+        std::vector<bool> maskRequested;
+        requests.reserve(layerNos.size() * (withMask ? 2 : 1));
+        for (int layerNo : layerNos) {
+            requests.push_back(makeLayerImageRequest(layerNo, "maskedimage"));
+            // マスクの無いレイヤーはダミーを作らずにNoneを返す
+            bool mask = withMask && hasLayerMask(layerNo);
+            if (mask) {
+                requests.push_back(makeLayerImageRequest(layerNo, "mask"));
+            }
+            maskRequested.push_back(mask);
+        }
+
+        std::vector<std::unique_ptr<std::vector<uint8_t>>> buffers(requests.size());
+        {
+            py::gil_scoped_release release;
+            for (size_t i = 0; i < requests.size(); i++) {
+                buffers[i] = decodeLayerImage(requests[i]);
+            }
+        }
+
+        py::list result;
+        size_t n = 0;
+        for (size_t i = 0; i < layerNos.size(); i++) {
+            const LayerImageRequest& req = requests[n];
+            py::array_t<uint8_t> image = wrapImageBuffer(std::move(buffers[n]), req.width, req.height);
+            n++;
+            if (withMask) {
+                py::object mask = py::none();
+                if (maskRequested[i]) {
+                    const LayerImageRequest& maskReq = requests[n];
+                    mask = wrapImageBuffer(std::move(buffers[n]), maskReq.width, maskReq.height);
+                    n++;
                 }
+                result.append(py::make_tuple(image, mask));
+            } else {
+                result.append(image);
             }
         }
-        
-        return array;
+        return result;
     }
 
     // 合成結果をNumPy配列として取得
-    py::array_t<uint8_t> getBlend() {
+    // channel を指定した場合はそのチャンネルだけの (height, width) 配列を返す
+    py::array_t<uint8_t> getBlend(std::optional<int> channel = std::nullopt) {
+        checkChannel(channel);
         if (!isLoaded) {
             throw std::runtime_error("No PSD data loaded");
         }
@@ -286,27 +530,25 @@ public:
         int width = header.width;
         int height = header.height;
         
-        // BGRA形式でデータを取得するためのバッファを作成
-        py::array_t<uint8_t> array({height, width, 4});
-        auto buf = array.mutable_unchecked<3>();
-        
         // 1行あたりのバイト数
         int pitch = width * 4;
         
-        // 画像データを取得
-        std::vector<uint8_t> buffer(pitch * height);
-        getMergedImage(buffer.data(), psd::BGRA_LE, pitch);
-        
-        // NumPy配列にデータをコピー
-        for (int y = 0; y < height; y++) {
-            for (int x = 0; x < width; x++) {
-                for (int c = 0; c < 4; c++) {
-                    buf(y, x, c) = buffer[y * pitch + x * 4 + c];
-                }
+        // 画像データを取得し、バッファをそのままNumPy配列として返す
+        std::unique_ptr<std::vector<uint8_t>> buffer;
+        {
+            // 合成中はGILを解放
+            py::gil_scoped_release release;
+            buffer.reset(new std::vector<uint8_t>(static_cast<size_t>(pitch) * height));
+            {
+                std::lock_guard<std::mutex> lock(decodeMutex);
+                getMergedImage(buffer->data(), psd::BGRA_LE, pitch);
+            }
+            if (channel) {
+                buffer = extractChannel(*buffer, width, height, *channel);
             }
         }
         
-        return array;
+        return wrapImageBuffer(std::move(buffer), width, height, channel ? 1 : 4);
     }
 
     // スライス情報をPython辞書で取得
@@ -460,19 +702,26 @@ PYBIND11_MODULE(module, m) {
         .def(py::init<>())
         .def("load_from_file", &PythonPSD::loadFromFile, "Load PSD data from a file", py::arg("filepath"))
         .def("load_from_bytes", &PythonPSD::loadFromBytes, "Load PSD data from bytes", py::arg("bytes"))
+        .def("load_from_buffer", &PythonPSD::loadFromBuffer, "Load PSD data from a buffer without copying", py::arg("buffer"))
+        .def("clear", &PythonPSD::clearData, "Release the loaded PSD data and its source buffer")
         .def("get_basic_info", &PythonPSD::getBasicInfo, "Get basic information about the PSD file")
         .def("get_layer_type", &PythonPSD::getLayerType, "Get layer type", py::arg("layer_no"))
         .def("get_layer_name", &PythonPSD::getLayerName, "Get layer name", py::arg("layer_no"))
+        .def("get_all_layer_names", &PythonPSD::getAllLayerNames, "Get names of all layers")
         .def("get_layer_info", &PythonPSD::getLayerInfo, "Get detailed layer information", py::arg("layer_no"))
+        .def("get_all_layers_info", &PythonPSD::getAllLayersInfo, "Get detailed information of all layers")
+        .def("has_layer_mask", &PythonPSD::hasLayerMask, "Check whether a layer has a mask", py::arg("layer_no"))
         .def("get_layer_data", &PythonPSD::getLayerData, "Get layer image data as numpy array", 
-             py::arg("layer_no"), py::arg("mode") = "maskedimage")
-        .def("get_layer_data_raw", [](PythonPSD &self, int layerNo) { 
-            return self.getLayerData(layerNo, "raw"); 
-        }, "Get raw layer image data", py::arg("layer_no"))
-        .def("get_layer_data_mask", [](PythonPSD &self, int layerNo) { 
-            return self.getLayerData(layerNo, "mask"); 
-        }, "Get layer mask data", py::arg("layer_no"))
-        .def("get_blend", &PythonPSD::getBlend, "Get composite image")
+             py::arg("layer_no"), py::arg("mode") = "maskedimage", py::arg("channel") = py::none())
+        .def("get_layers_data", &PythonPSD::getLayersData, "Get image data of multiple layers with a single GIL release",
+             py::arg("layer_nos"), py::arg("with_mask") = false)
+        .def("get_layer_data_raw", [](PythonPSD &self, int layerNo, std::optional<int> channel) { 
+            return self.getLayerData(layerNo, "raw", channel); 
+        }, "Get raw layer image data", py::arg("layer_no"), py::arg("channel") = py::none())
+        .def("get_layer_data_mask", [](PythonPSD &self, int layerNo, std::optional<int> channel) { 
+            return self.getLayerData(layerNo, "mask", channel); 
+        }, "Get layer mask data", py::arg("layer_no"), py::arg("channel") = py::none())
+        .def("get_blend", &PythonPSD::getBlend, "Get composite image", py::arg("channel") = py::none())
         .def("get_slices", &PythonPSD::getSlices, "Get slice information")
         .def("get_guides", &PythonPSD::getGuides, "Get guide information")
         .def("get_layer_comp", &PythonPSD::getLayerComp, "Get layer composition information")
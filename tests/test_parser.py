@@ -0,0 +1,346 @@
+"""
+Smoke tests for the Python layer of PSDParser
+
+The native PSD object is replaced with a small fake, so these run without
+a PSD file. If the extension is not built, a stand-in psdfile.module is
+registered so that parser.py can be imported.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+try:
+    import psdfile.module  # noqa: F401
+except ImportError:
+    _module = types.ModuleType("psdfile.module")
+    for _name in ("PSD", "ColorMode", "LayerType", "BlendMode"):
+        setattr(_module, _name, type(_name, (), {}))
+    sys.modules["psdfile.module"] = _module
+
+from psdfile.parser import PSDParser, _unique_names
+
+
+class FakePSD:
+    """Minimal stand-in for the native PSD object"""
+
+    def __init__(self, info):
+        self.info = info
+        self.calls = 0
+        self.source = None
+
+    def get_basic_info(self):
+        self.calls += 1
+        return dict(self.info)
+
+    def clear(self):
+        self.source = None
+
+    def load_from_buffer(self, buffer):
+        # Like PythonPSD.sourceBuffer, keep the buffer exported while loaded
+        self.source = memoryview(buffer)
+        return len(self.source) > 0
+
+
+INFO = {
+    "width": 64,
+    "height": 32,
+    "channels": 4,
+    "depth": 8,
+    "color_mode": 3,
+    "layer_count": 2,
+}
+
+
+def make_parser(loaded=True):
+    parser = PSDParser()
+    parser.psd = FakePSD(INFO if loaded else {})
+    parser._loaded = loaded
+    return parser
+
+
+class InfoTest(unittest.TestCase):
+    def test_info_and_parse(self):
+        parser = make_parser()
+        self.assertEqual(parser.info, INFO)
+        self.assertEqual(parser.parse(), INFO)
+        self.assertEqual(parser.psd.calls, 1)
+
+    def test_info_is_a_copy(self):
+        parser = make_parser()
+        parser.info["width"] = 1
+        parser.parse()["height"] = 1
+        self.assertEqual(parser.info, INFO)
+
+    def test_info_requires_loaded(self):
+        parser = make_parser(loaded=False)
+        with self.assertRaises(RuntimeError):
+            parser.info
+        with self.assertRaises(RuntimeError):
+            parser.parse()
+
+
+class HeaderTest(unittest.TestCase):
+    def test_header_properties(self):
+        parser = make_parser()
+        self.assertEqual(parser.width, 64)
+        self.assertEqual(parser.height, 32)
+        self.assertEqual(parser.channels, 4)
+        self.assertEqual(parser.depth, 8)
+        self.assertEqual(parser.color_mode, 3)
+        self.assertEqual(parser.layer_count, 2)
+        self.assertEqual(parser.psd.calls, 1)
+
+    def test_header_properties_unloaded(self):
+        parser = make_parser(loaded=False)
+        self.assertEqual(parser.width, -1)
+        self.assertEqual(parser.layer_count, -1)
+        self.assertEqual(parser.psd.calls, 0)
+
+    def test_header_survives_info_mutation(self):
+        parser = make_parser()
+        parser.info["width"] = 1
+        self.assertEqual(parser.width, 64)
+
+
+def _unique_names_reference(names, has_masks):
+    """The original extract_all_layers naming loop, kept as the reference"""
+    result = {}
+    unique_names = []
+    for name, has_mask in zip(names, has_masks):
+        unique_name = name
+        counter = 1
+        while unique_name in result:
+            unique_name = f"{name} ({counter})"
+            counter += 1
+        result[unique_name] = True
+        unique_names.append(unique_name)
+        if has_mask:
+            result[f"{unique_name} (mask)"] = True
+    return unique_names
+
+
+class UniqueNamesTest(unittest.TestCase):
+    CASES = [
+        ([], []),
+        (["A"], ["A"]),
+        (["A", "B"], ["A", "B"]),
+        (["A", "A", "A"], ["A", "A (1)", "A (2)"]),
+        (["A", "A (1)", "A"], ["A", "A (1)", "A (2)"]),
+        (["A", "A", "A (1)"], ["A", "A (1)", "A (1) (1)"]),
+        (["A (1)", "A", "A"], ["A (1)", "A", "A (2)"]),
+        (["A", "A (2)", "A", "A"], ["A", "A (2)", "A (1)", "A (3)"]),
+        (["A", "B", "A", "B"], ["A", "B", "A (1)", "B (1)"]),
+    ]
+
+    MASK_CASES = [
+        (["A", "A (mask)"], [True, False], ["A", "A (mask) (1)"]),
+        (["A", "A (mask)"], [False, False], ["A", "A (mask)"]),
+        (["A", "A", "A (1) (mask)"], [False, True, False], ["A", "A (1)", "A (1) (mask) (1)"]),
+        (["A", "A"], [True, True], ["A", "A (1)"]),
+    ]
+
+    def test_names(self):
+        for names, expected in self.CASES:
+            with self.subTest(names=names):
+                self.assertEqual(_unique_names(names), expected)
+                self.assertEqual(_unique_names_reference(names, [False] * len(names)), expected)
+
+    def test_names_with_masks(self):
+        for names, has_masks, expected in self.MASK_CASES:
+            with self.subTest(names=names, has_masks=has_masks):
+                self.assertEqual(_unique_names(names, has_masks), expected)
+                self.assertEqual(_unique_names_reference(names, has_masks), expected)
+
+    def test_matches_reference(self):
+        pool = ["A", "A (1)", "A (2)", "A (mask)", "A (1) (mask)", "A (1) (1)", "B"]
+        for n in range(5):
+            for i in range(len(pool) ** n if n < 4 else 500):
+                names = [pool[(i // len(pool) ** k) % len(pool)] for k in range(n)]
+                has_masks = [(i >> k) & 1 == 1 for k in range(n)]
+                self.assertEqual(_unique_names(names, has_masks),
+                                 _unique_names_reference(names, has_masks))
+
+
+class ExtractAllLayersTest(unittest.TestCase):
+    class LayersPSD(FakePSD):
+        def get_all_layer_names(self):
+            return ["A", "A", "B"]
+
+        def get_layers_data(self, layer_nos, with_mask):
+            images = ["image%d" % i for i in layer_nos]
+            if not with_mask:
+                return images
+            masks = ["mask0", None, None]
+            return [(images[i], masks[i]) for i in layer_nos]
+
+    def make(self):
+        parser = PSDParser()
+        parser.psd = self.LayersPSD(INFO)
+        parser._loaded = True
+        return parser
+
+    def test_without_masks(self):
+        result = self.make().extract_all_layers()
+        self.assertEqual(result, {"A": "image0", "A (1)": "image1", "B": "image2"})
+
+    def test_with_masks_skips_none(self):
+        result = self.make().extract_all_layers(get_mask=True)
+        self.assertEqual(result, {
+            "A": "image0",
+            "A (mask)": "mask0",
+            "A (1)": "image1",
+            "B": "image2",
+        })
+
+
+class LoadFileTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".psd")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"8BPS")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_failed_load_closes_mapping(self):
+        mappings = []
+
+        class FailingPSD(FakePSD):
+            def load_from_buffer(self, buffer):
+                mappings.append(buffer.obj)
+                return False
+
+        parser = PSDParser()
+        parser.psd = FailingPSD(INFO)
+        self.assertFalse(parser.load(self.path))
+        self.assertIsNone(parser._mm)
+        self.assertTrue(mappings[0].closed)
+
+    def test_load_path_seeds_file_info(self):
+        parser = PSDParser()
+        parser.psd = FakePSD(INFO)
+        self.assertTrue(parser.load(self.path))
+        self.assertEqual(parser.info, INFO)
+        self.assertEqual(parser.width, 64)
+        self.assertEqual(parser.psd.calls, 1)
+        # Served from the cache seeded by load(), without parsing again
+        self.assertEqual(PSDParser.read_info(self.path), INFO)
+        parser.psd.clear()
+        parser._mm.close()
+
+    def test_load_error_closes_mapping(self):
+        mappings = []
+
+        class RaisingPSD(FakePSD):
+            def load_from_buffer(self, buffer):
+                mappings.append(buffer.obj)
+                # Like PythonPSD, hold no reference to the buffer on error
+                del buffer
+                raise ValueError("broken")
+
+        parser = PSDParser()
+        parser.psd = RaisingPSD(INFO)
+        with self.assertRaises(RuntimeError) as cm:
+            parser.load(self.path)
+        self.assertIsInstance(cm.exception.__cause__, ValueError)
+        self.assertTrue(mappings[0].closed)
+
+    def test_context_manager_closes(self):
+        parser = PSDParser()
+        parser.psd = FakePSD(INFO)
+        with parser:
+            self.assertTrue(parser.load(self.path))
+            mm = parser._mm
+            self.assertEqual(parser.width, 64)
+        self.assertIsNone(parser._mm)
+        self.assertTrue(mm.closed)
+        self.assertFalse(parser.is_loaded)
+        self.assertEqual(parser.width, -1)
+        self.assertEqual(parser.layer_count, -1)
+
+    def test_empty_file(self):
+        with open(self.path, "wb"):
+            pass
+        parser = PSDParser()
+        parser.psd = FakePSD(INFO)
+        self.assertFalse(parser.load(self.path))
+        self.assertFalse(parser.is_loaded)
+
+
+class LoadBytesTest(unittest.TestCase):
+    def test_bytes_use_buffer_loader(self):
+        class BufferOnlyPSD(FakePSD):
+            def load_from_bytes(self, data):
+                raise AssertionError("bytes should not be copied")
+
+        parser = PSDParser()
+        parser.psd = BufferOnlyPSD(INFO)
+        self.assertTrue(parser.load(b"8BPS"))
+
+
+class LoadBytesIOTest(unittest.TestCase):
+    def test_bytesio_is_not_locked(self):
+        parser = PSDParser()
+        parser.psd = FakePSD(INFO)
+        with io.BytesIO(b"8BPS") as bio:
+            self.assertTrue(parser.load(bio))
+            bio.write(b"more")
+        self.assertTrue(parser.is_loaded)
+
+
+class LoadDispatchTest(unittest.TestCase):
+    def make(self):
+        parser = PSDParser()
+        parser.psd = FakePSD(INFO)
+        return parser
+
+    def test_bytes_subclass(self):
+        class Data(bytes):
+            pass
+
+        parser = self.make()
+        self.assertTrue(parser.load(Data(b"8BPS")))
+        self.assertEqual(bytes(parser.psd.source), b"8BPS")
+
+    def test_str_subclass(self):
+        class Path(str):
+            pass
+
+        fd, path = tempfile.mkstemp(suffix=".psd")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"8BPS")
+        parser = self.make()
+        try:
+            self.assertTrue(parser.load(Path(path)))
+            self.assertIsNotNone(parser._mm)
+        finally:
+            parser.psd.clear()
+            if parser._mm is not None:
+                parser._mm.close()
+            os.remove(path)
+
+    def test_unsupported_type(self):
+        parser = self.make()
+        with self.assertRaises(RuntimeError) as cm:
+            parser.load(12345)
+        self.assertIsInstance(cm.exception.__cause__, TypeError)
+        self.assertFalse(parser.is_loaded)
+
+    def test_unsupported_type_keeps_previous_load(self):
+        parser = self.make()
+        self.assertTrue(parser.load(b"8BPS"))
+        with self.assertRaises(RuntimeError):
+            parser.load(12345)
+        self.assertTrue(parser.is_loaded)
+        self.assertEqual(bytes(parser.psd.source), b"8BPS")
+        self.assertEqual(parser.width, 64)
+
+
+if __name__ == "__main__":
+    unittest.main()